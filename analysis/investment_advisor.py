@@ -82,9 +82,13 @@ class InvestmentAdvisor:
         else:
             sentiment_trend = 0
         
-        # Volume trend (posting activity)
-        df['date'] = pd.to_datetime(df['created_utc']).dt.date
-        daily_counts = df.groupby('date').size()
+        # Volume trend (posting activity) - bucket on datetime64 days rather than
+        # Python date objects, reusing the loader's precomputed day column when present
+        if 'date' in df.columns:
+            days = df['date']
+        else:
+            days = pd.to_datetime(df['created_utc'], utc=True).dt.floor('D')
+        daily_counts = days.value_counts().sort_index()
         if len(daily_counts) >= 3:
             recent_volume = daily_counts.tail(len(daily_counts)//3).mean()
             older_volume = daily_counts.head(len(daily_counts)//3).mean()
@@ -97,7 +101,7 @@ class InvestmentAdvisor:
             "sentiment_trend": sentiment_trend,
             "volume_trend": volume_trend,
             "total_posts": len(df),
-            "positive_ratio": len(df[df['compound'] > 0.1]) / len(df) if len(df) > 0 else 0
+            "positive_ratio": float((df['compound'].to_numpy() > 0.1).mean())
         }
     
     def _calculate_technical_metrics(self):
@@ -2,7 +2,9 @@ import pandas as pd
 import numpy as np
 import yfinance as yf
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import heapq
 import json
 from typing import Dict, List, Tuple, Optional
 import warnings
@@ -19,6 +21,8 @@ class QuantitativeStrategies:
         self.performance_data = {}
         self.risk_metrics = {}
         self.rebalance_frequency = 'weekly'
+        # Price momentum per ticker, shared by every strategy built on this instance
+        self._price_momentum_cache = {}
         # Free data sources we can access
         self.free_data_sources = {
             'insider_trading': 'SEC EDGAR API',
@@ -51,6 +55,11 @@ class QuantitativeStrategies:
             'confidence_level': 0.0
         }
         
+        # Price history lookups are network-bound, so fetch them all up front in parallel
+        price_momentum_scores = self._calculate_price_momentum_batch(
+            [ticker for ticker in tickers if ticker in sentiment_data]
+        )
+        
         # Calculate multi-dimensional sentiment scores
         for ticker in tickers:
             if ticker in sentiment_data:
@@ -67,8 +76,7 @@ class QuantitativeStrategies:
                 strategy['volume_scores'][ticker] = volume_momentum
                 
                 # Price momentum confirmation
-                price_momentum = self._calculate_price_momentum(ticker)
-                strategy['momentum_scores'][ticker] = price_momentum
+                strategy['momentum_scores'][ticker] = price_momentum_scores[ticker]
         
         # Combine scores using QuantBase-style weighting
         combined_scores = self._combine_quantbase_scores(
@@ -436,11 +444,17 @@ class QuantitativeStrategies:
             'factor_scores': {}
         }
         
+        # Price momentum comes from the shared batch, so tickers already scored by
+        # another strategy on this instance are not downloaded again
+        price_momentum_scores = self._calculate_price_momentum_batch(
+            [ticker for ticker in tickers if ticker in sentiment_data]
+        )
+        
         # Calculate multi-factor scores
         for ticker in tickers:
             if ticker in sentiment_data:
                 sentiment_score = self._calculate_advanced_sentiment_momentum(sentiment_data[ticker])
-                momentum_score = self._calculate_price_momentum(ticker)
+                momentum_score = price_momentum_scores[ticker]
                 volatility_score = self._calculate_volatility_score(ticker)
                 
                 # Combine factors
@@ -497,8 +511,7 @@ class QuantitativeStrategies:
         
         # Allocate to top sectors
         if strategy['sector_scores']:
-            sorted_sectors = sorted(strategy['sector_scores'].items(), key=lambda x: x[1], reverse=True)
-            top_sectors = sorted_sectors[:3]  # Top 3 sectors
+            top_sectors = heapq.nlargest(3, strategy['sector_scores'].items(), key=lambda x: x[1])  # Top 3 sectors
             
             total_score = sum(score for _, score in top_sectors if score > 0)
             
@@ -567,9 +580,8 @@ class QuantitativeStrategies:
         if not scores:
             return {}
         
-        # Sort by score and take top positions
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        top_positions = sorted_scores[:max_positions]
+        # Take the top positions by score without sorting the whole universe
+        top_positions = heapq.nlargest(max_positions, scores.items(), key=lambda x: x[1])
         
         # Filter out negative scores
         positive_positions = [(ticker, score) for ticker, score in top_positions if score > 0]
@@ -631,20 +643,20 @@ class QuantitativeStrategies:
     
     def _combine_quantbase_scores(self, sentiment_scores: Dict, volume_scores: Dict, momentum_scores: Dict) -> Dict:
         """Combine multiple score types using QuantBase-style weighting."""
-        combined = {}
+        all_tickers = list(set(sentiment_scores.keys()) | set(volume_scores.keys()) | set(momentum_scores.keys()))
+        if not all_tickers:
+            return {}
         
-        all_tickers = set(sentiment_scores.keys()) | set(volume_scores.keys()) | set(momentum_scores.keys())
+        # One (ticker x factor) matrix, reduced with a single matrix-vector product
+        factor_scores = np.array([
+            [sentiment_scores.get(ticker, 0.0), volume_scores.get(ticker, 0.0), momentum_scores.get(ticker, 0.0)]
+            for ticker in all_tickers
+        ], dtype=float)
         
-        for ticker in all_tickers:
-            sentiment = sentiment_scores.get(ticker, 0.0)
-            volume = volume_scores.get(ticker, 0.0)
-            momentum = momentum_scores.get(ticker, 0.0)
-            
-            # QuantBase-style weighting
-            combined_score = (sentiment * 0.5) + (volume * 0.2) + (momentum * 0.3)
-            combined[ticker] = combined_score
+        # QuantBase-style weighting: sentiment 50%, volume 20%, momentum 30%
+        combined_scores = factor_scores @ np.array([0.5, 0.2, 0.3])
         
-        return combined
+        return dict(zip(all_tickers, combined_scores.tolist()))
     
     def _calculate_quantbase_risk_score(self, weights: Dict) -> float:
         """Calculate risk score for the strategy."""
@@ -855,26 +867,46 @@ class QuantitativeStrategies:
         except Exception as e:
             return 0.0
     
+    def _calculate_price_momentum_batch(self, tickers: List[str]) -> Dict[str, float]:
+        """Calculate price momentum for several tickers concurrently, reusing earlier results."""
+        missing = [ticker for ticker in dict.fromkeys(tickers) if ticker not in self._price_momentum_cache]
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+                self._price_momentum_cache.update(
+                    zip(missing, executor.map(self._calculate_price_momentum, missing))
+                )
+        return {ticker: self._price_momentum_cache[ticker] for ticker in tickers}
+    
     def _estimate_strategy_return(self, weights: Dict) -> float:
         """Estimate expected return of strategy."""
         if not weights:
             return 0.0
         
+        # Each position needs its own history download; fetch them concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(weights))) as executor:
+            annual_returns = executor.map(self._calculate_annual_return, weights)
+        
         total_expected = 0.0
-        for ticker, weight in weights.items():
-            try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period="1y")
-                
-                if len(hist) > 252:  # At least 1 year of data
-                    annual_return = (hist['Close'].iloc[-1] / hist['Close'].iloc[0]) - 1
-                    total_expected += weight * annual_return
-                    
-            except:
-                continue
+        for weight, annual_return in zip(weights.values(), annual_returns):
+            if annual_return is not None:
+                total_expected += weight * annual_return
         
         return total_expected
     
+    def _calculate_annual_return(self, ticker: str) -> Optional[float]:
+        """Calculate trailing one-year return, or None when history is unavailable."""
+        try:
+            stock = yf.Ticker(ticker)
+            hist = stock.history(period="1y")
+            
+            if len(hist) > 252:  # At least 1 year of data
+                return (hist['Close'].iloc[-1] / hist['Close'].iloc[0]) - 1
+                
+        except:
+            pass
+        
+        return None
+    
     def _calculate_strategy_confidence(self, combined_scores: Dict) -> float:
         """Calculate confidence level based on score distribution."""
         if not combined_scores:
@@ -932,14 +964,14 @@ class QuantitativeStrategies:
         if not insider_scores:
             return []
         
-        # Sort by insider score
-        sorted_scores = sorted(
+        # Take the top insider scores without sorting every candidate
+        top_scores = heapq.nlargest(
+            top_n,
             insider_scores.items(), 
-            key=lambda x: x[1].get('score', 0.0), 
-            reverse=True
+            key=lambda x: x[1].get('score', 0.0)
         )
         
-        return [ticker for ticker, score in sorted_scores[:top_n]]
+        return [ticker for ticker, score in top_scores]
     
     def _create_equal_weight_portfolio(self, tickers: List[str]) -> Dict:
         """Create equal-weighted portfolio."""
@@ -1007,14 +1039,14 @@ class QuantitativeStrategies:
         if not lobbying_data:
             return []
         
-        # Sort by quarterly spending
-        sorted_companies = sorted(
+        # Take the top quarterly spenders without sorting every company
+        top_companies = heapq.nlargest(
+            top_n,
             lobbying_data.items(),
-            key=lambda x: x[1].get('quarterly_spending', 0),
-            reverse=True
+            key=lambda x: x[1].get('quarterly_spending', 0)
         )
         
-        return [ticker for ticker, data in sorted_companies[:top_n]]
+        return [ticker for ticker, data in top_companies]
     
     def _calculate_comprehensive_crisis_indicators(self, benchmark: str) -> Dict:
         """Calculate comprehensive crisis indicators."""
@@ -1245,6 +1277,11 @@ class QuantitativeStrategies:
             'confidence_level': 0.0
         }
         
+        # Price history lookups are network-bound, so fetch them all up front in parallel
+        price_momentum_scores = self._calculate_price_momentum_batch(
+            [ticker for ticker in tickers if ticker in sentiment_data]
+        )
+        
         # Calculate sentiment scores for each ticker
         for ticker in tickers:
             if ticker in sentiment_data:
@@ -1255,7 +1292,7 @@ class QuantitativeStrategies:
                 strategy['sentiment_scores'][ticker] = sentiment_momentum
                 
                 # Get price momentum
-                price_momentum = self._calculate_price_momentum(ticker)
+                price_momentum = price_momentum_scores[ticker]
                 strategy['momentum_scores'][ticker] = price_momentum
                 
                 # Combine sentiment and price momentum
@@ -1268,7 +1305,7 @@ class QuantitativeStrategies:
         )
         
         # Select top picks
-        sorted_scores = sorted(strategy['combined_scores'].items(), key=lambda x: x[1], reverse=True)
+        top_scores = heapq.nlargest(10, strategy['combined_scores'].items(), key=lambda x: x[1])
         strategy['top_picks'] = [
             {
                 'ticker': ticker,
@@ -1277,7 +1314,7 @@ class QuantitativeStrategies:
                 'sentiment_score': strategy['sentiment_scores'].get(ticker, 0.0),
                 'momentum_score': strategy['momentum_scores'].get(ticker, 0.0)
             }
-            for ticker, score in sorted_scores[:10]
+            for ticker, score in top_scores
         ]
         
         # Calculate confidence level
@@ -11,11 +11,22 @@ import sys
 import os
 import asyncio
 import json
+import heapq
 from datetime import datetime, timedelta
 from functools import lru_cache
+from pathlib import Path
 import logging
 from enum import Enum
 from dotenv import load_dotenv
+# pandas/numpy are already loaded at startup by the fundamentals service, so they
+# are imported once here rather than re-resolved inside each handler
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Load environment variables from .env file
 load_dotenv()
@@ -75,32 +86,32 @@ async def verify_password_with_role(password: str = Query(..., description="Pass
 # Add the parent directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Import your existing functions
-from main import run_full_pipeline_async
-from scraping.news_scraper import fetch_news_sentiment
-from scraping.enhanced_news_scraper import fetch_enhanced_news_sentiment
-from analysis.investment_advisor import InvestmentAdvisor
-from analysis.quantitative_strategies import QuantitativeStrategies
+# Analysis modules (TA-Lib, scikit-learn) and scrapers are imported lazily by the
+# endpoints and fetchers that use them, keeping startup and baseline memory low
 
 # Import fundamentals router
 from backend.routers.fundamentals import router as fundamentals_router
 
+# Sentiment data files written by the scrapers
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
 # Add utility functions directly to replace the removed ones
 def get_available_tickers():
     """Get list of available stock tickers from data files"""
     try:
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
-        if not os.path.exists(data_dir):
+        if not os.path.exists(DATA_DIR):
             return []
         
-        tickers = set()
-        for filename in os.listdir(data_dir):
-            if filename.endswith('_sentiment.json') or filename.endswith('.json'):
-                # Extract ticker from filename (e.g., AAPL_reddit_sentiment.json -> AAPL)
-                ticker = filename.split('_')[0]
-                tickers.add(ticker)
+        # Extract ticker from filename (e.g., AAPL_reddit_sentiment.json -> AAPL),
+        # skipping files that hold nothing but an empty JSON list ("[]" is 2 bytes)
+        with os.scandir(DATA_DIR) as entries:
+            tickers = {
+                entry.name.split('_')[0]
+                for entry in entries
+                if entry.name.endswith('.json') and entry.stat().st_size > 2
+            }
         
-        return sorted(list(tickers))
+        return sorted(tickers)
     except Exception as e:
         logger.error(f"Error getting available tickers: {e}")
         return []
@@ -119,7 +130,7 @@ def validate_stock_symbol(symbol: str) -> tuple[bool, str]:
         
         # Check with yfinance
         ticker = yf.Ticker(symbol)
-        info = ticker.info
+        info = get_ticker_info(symbol)
         
         # Check if we got valid data back
         if 'symbol' not in info and 'shortName' not in info and 'longName' not in info:
@@ -139,30 +150,29 @@ def delete_stock_data(symbol: str) -> tuple[bool, str, list]:
     """Delete all data files for a given stock symbol"""
     try:
         symbol = symbol.upper().strip()
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
         
-        if not os.path.exists(data_dir):
+        if not os.path.exists(DATA_DIR):
             return False, "Data directory not found", []
         
-        # Find all files for this symbol
-        files_to_delete = []
-        for filename in os.listdir(data_dir):
-            if filename.startswith(f"{symbol}_") and filename.endswith('.json'):
-                files_to_delete.append(filename)
+        # Find all files for this symbol in a single directory scan
+        with os.scandir(DATA_DIR) as entries:
+            files_to_delete = [
+                entry for entry in entries
+                if entry.name.startswith(f"{symbol}_") and entry.name.endswith('.json') and entry.is_file()
+            ]
         
         if not files_to_delete:
             return False, f"No data files found for symbol '{symbol}'", []
         
         # Delete the files
         deleted_files = []
-        for filename in files_to_delete:
-            file_path = os.path.join(data_dir, filename)
+        for entry in files_to_delete:
             try:
-                os.remove(file_path)
-                deleted_files.append(filename)
-                logger.info(f"Deleted file: {filename}")
+                os.unlink(entry.path)
+                deleted_files.append(entry.name)
+                logger.info(f"Deleted file: {entry.name}")
             except Exception as e:
-                logger.error(f"Failed to delete {filename}: {e}")
+                logger.error(f"Failed to delete {entry.name}: {e}")
         
         return True, f"Successfully deleted {len(deleted_files)} files for '{symbol}'", deleted_files
         
@@ -170,100 +180,165 @@ def delete_stock_data(symbol: str) -> tuple[bool, str, list]:
         logger.error(f"Error deleting stock data for {symbol}: {e}")
         return False, f"Error deleting data: {str(e)}", []
 
+def load_json(path):
+    """Read a JSON data file, using orjson for the parse when it is installed"""
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+@lru_cache(maxsize=128)
+def load_json_cached(path, mtime_ns, size):
+    """Parse a JSON data file once per (mtime, size) signature; treat the result as read-only"""
+    return load_json(path)
+
+SENTIMENT_SOURCES = ['Reddit', 'News', 'SEC', 'Twitter', 'Unknown']
+SENTIMENT_LABELS = ['positive', 'neutral', 'negative']
+SENTIMENT_COLUMNS = ['title', 'source', 'sentiment', 'compound', 'created_utc']
+# Bucket edges for negative / neutral / positive compound scores; with
+# searchsorted(side='right') the upper edge must sit just above 0.1 so that the
+# positive bucket stays strictly > 0.1
+SENTIMENT_BUCKET_EDGES = np.array([-0.1, np.nextafter(0.1, np.inf)])
+# Twitter records carry their ISO timestamp in 'date', so it is checked last
+TIMESTAMP_FIELDS = ('created_utc', 'created', 'publishedAt', 'timestamp', 'date')
+
+def parse_created_utc(df):
+    """Resolve a UTC timestamp per record from the first usable timestamp field; NaT if none"""
+    created = pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns, UTC]')
+    for field in TIMESTAMP_FIELDS:
+        if field not in df.columns:
+            continue
+        values = df[field]
+        # Unix epochs are numeric; anything else is parsed as a date string and
+        # naive values are taken to be UTC. Falsy values are skipped as before.
+        epochs = pd.to_numeric(values, errors='coerce')
+        parsed = pd.to_datetime(epochs.where(epochs != 0), unit='s', utc=True)
+        text = values.where(epochs.isna() & values.notna() & (values != ''))
+        if text.notna().any():
+            parsed = parsed.fillna(pd.to_datetime(text, utc=True, errors='coerce', format='mixed'))
+        created = created.fillna(parsed.astype('datetime64[ns, UTC]'))
+    
+    return created
+
+def get_ticker_data_files(ticker) -> tuple:
+    """Return (filename, mtime_ns, size) for every data file belonging to a ticker"""
+    with os.scandir(DATA_DIR) as entries:
+        return tuple(sorted(
+            (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+            for entry in entries
+            if entry.name.startswith(f"{ticker}_") and entry.name.endswith('.json')
+        ))
+
 def load_dataframes(ticker):
     """Load and combine all sentiment data for a ticker into a single DataFrame"""
-    import pandas as pd
+    try:
+        data_files = get_ticker_data_files(ticker)
+    except Exception as e:
+        logger.error(f"Error loading dataframes for {ticker}: {e}")
+        return pd.DataFrame()
+    
+    # The file signature (names, mtimes, sizes) is part of the cache key, so any
+    # rewrite by a scraper transparently invalidates the cached frame. Callers get
+    # a shallow copy so adding columns never leaks into the cache.
+    df = _load_dataframes_cached(ticker, data_files).copy(deep=False)
     
+    # Fallback to current time if no valid timestamp (timezone-aware). This happens
+    # per request: stamping inside the cached frame would freeze the fill time.
+    missing = df['created_utc'].isna() if 'created_utc' in df.columns else None
+    if missing is not None and missing.any():
+        now = pd.Timestamp.now(tz='UTC')
+        df['created_utc'] = df['created_utc'].fillna(now)
+        df['date'] = df['date'].fillna(now.floor('D'))
+    return df
+
+@lru_cache(maxsize=64)
+def _load_dataframes_cached(ticker, data_files):
+    """Parse and combine a ticker's data files; memoized on the file signature"""
     try:
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
-        combined_data = []
+        frames = []
         
         # Look for all files matching the ticker pattern
-        for filename in os.listdir(data_dir):
-            if filename.startswith(f"{ticker}_") and filename.endswith('.json'):
-                file_path = os.path.join(data_dir, filename)
+        for filename, _, _ in data_files:
+            file_path = os.path.join(DATA_DIR, filename)
+            
+            try:
+                data = load_json(file_path)
                 
-                try:
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                    
-                    # Determine source from filename
-                    if 'reddit' in filename:
-                        source = 'Reddit'
-                    elif 'news' in filename:
-                        source = 'News'
-                    elif 'sec' in filename:
-                        source = 'SEC'
-                    else:
-                        source = 'Unknown'
-                    
-                    # Process each item in the data
-                    for item in data:
-                        if isinstance(item, dict):
-                            # Add source info
-                            item['source'] = source
-                            
-                            # Standardize sentiment data - handle nested sentiment objects
-                            if 'sentiment' in item and isinstance(item['sentiment'], dict):
-                                # Extract sentiment scores from nested object
-                                sentiment_data = item['sentiment']
-                                item['compound'] = sentiment_data.get('compound', 0.0)
-                                item['pos'] = sentiment_data.get('pos', 0.0)
-                                item['neg'] = sentiment_data.get('neg', 0.0)
-                                item['neu'] = sentiment_data.get('neu', 0.0)
-                                item['sentiment_label'] = sentiment_data.get('label', 'neutral')
-                            
-                            # Ensure compound score exists
-                            if 'compound' not in item:
-                                item['compound'] = 0.0
-                            
-                            # Handle different timestamp formats more robustly
-                            timestamp_fields = ['created_utc', 'created', 'publishedAt', 'timestamp']
-                            item['created_utc'] = None
-                            
-                            for field in timestamp_fields:
-                                if field in item and item[field]:
-                                    try:
-                                        if isinstance(item[field], (int, float)):
-                                            # Convert Unix timestamp to timezone-aware datetime
-                                            item['created_utc'] = pd.to_datetime(item[field], unit='s', utc=True)
-                                        else:
-                                            # Parse string datetime and ensure it's timezone-aware
-                                            dt = pd.to_datetime(item[field])
-                                            if dt.tz is None:
-                                                # If naive, assume UTC
-                                                item['created_utc'] = dt.tz_localize('UTC')
-                                            else:
-                                                # Already timezone-aware, convert to UTC
-                                                item['created_utc'] = dt.tz_convert('UTC')
-                                        break
-                                    except Exception as parse_error:
-                                        logger.debug(f"Failed to parse timestamp {field}={item[field]}: {parse_error}")
-                                        continue
-                            
-                            # Fallback to current time if no valid timestamp (timezone-aware)
-                            if item['created_utc'] is None:
-                                item['created_utc'] = pd.Timestamp.now(tz='UTC')
-                            
-                            combined_data.append(item)
+                # Determine source from filename
+                if 'reddit' in filename:
+                    source = 'Reddit'
+                elif 'news' in filename:
+                    source = 'News'
+                elif 'sec' in filename:
+                    source = 'SEC'
+                elif 'twitter' in filename:
+                    source = 'Twitter'
+                else:
+                    source = 'Unknown'
                 
-                except Exception as e:
-                    logger.warning(f"Error loading file {filename}: {e}")
-                    continue
+                # Flatten nested sentiment objects into 'sentiment.<field>' columns
+                records = [item for item in data if isinstance(item, dict)]
+                if records:
+                    frame = pd.json_normalize(records, max_level=1)
+                    frame['source'] = source
+                    frames.append(frame)
+                
+            except Exception as e:
+                logger.warning(f"Error loading file {filename}: {e}")
+                continue
         
-        if not combined_data:
+        if not frames:
             logger.warning(f"No valid data found for ticker {ticker}")
-            return pd.DataFrame()
-        
-        df = pd.DataFrame(combined_data)
-        
-        # Ensure required columns exist with proper defaults
-        if 'compound' not in df.columns:
-            df['compound'] = 0.0
-        if 'sentiment' not in df.columns:
-            df['sentiment'] = 'neutral'
-        if 'source' not in df.columns:
-            df['source'] = 'Unknown'
+            return pd.DataFrame(columns=SENTIMENT_COLUMNS)
+        
+        # Only populated sources reach the concat, so it allocates once
+        df = pd.concat(frames, ignore_index=True)
+        # Sources are a closed set; converting before any source comparison below
+        # makes those masks compare integer codes rather than strings
+        df['source'] = pd.Categorical(df['source'], categories=SENTIMENT_SOURCES)
+        
+        for score in ('compound', 'pos', 'neg', 'neu'):
+            nested = f'sentiment.{score}'
+            if nested in df.columns:
+                scores = df.pop(nested)
+                df[score] = scores.combine_first(df[score]) if score in df.columns else scores
+        df['compound'] = df['compound'].fillna(0.0) if 'compound' in df.columns else 0.0
+        
+        # Twitter records carry a top-level 'sentiment_label'; the other scrapers nest
+        # the label under 'sentiment'. The top-level field wins, neutral only when neither exists
+        label = df['sentiment_label'] if 'sentiment_label' in df.columns else pd.Series(None, index=df.index, dtype=object)
+        if 'sentiment.label' in df.columns:
+            label = label.combine_first(df.pop('sentiment.label'))
+        df['sentiment_label'] = label.fillna('neutral')
+        if 'sentiment' in df.columns:
+            df['sentiment'] = df['sentiment'].fillna(df['sentiment_label'])
+        else:
+            df['sentiment'] = df['sentiment_label']
+        
+        df['created_utc'] = parse_created_utc(df)
+        # Day buckets for volume trends, computed once per load rather than per request
+        df['date'] = df['created_utc'].dt.floor('D')
+        
+        # Twitter records keep their text in 'content' and author in 'username';
+        # map them onto the Reddit-style columns with one vectorized string op
+        if 'username' in df.columns:
+            is_twitter = df['source'] == 'Twitter'
+            df.loc[is_twitter, 'subreddit'] = '@' + df.loc[is_twitter, 'username'].fillna('unknown').astype(str)
+            if 'content' in df.columns:
+                df.loc[is_twitter, 'title'] = df.loc[is_twitter, 'content']
+        
+        # Sentiment labels are a closed set too, so store them as a categorical.
+        # Casing variants are folded first; anything still outside the set would
+        # become NaN in the categorical, so it is logged and treated as neutral
+        labels = df['sentiment'].astype(str).str.strip().str.lower()
+        unexpected = ~labels.isin(SENTIMENT_LABELS)
+        if unexpected.any():
+            logger.warning(
+                f"{int(unexpected.sum())} records for {ticker} have unexpected sentiment labels "
+                f"{sorted(labels[unexpected].unique())}; treating them as neutral"
+            )
+            labels = labels.mask(unexpected, 'neutral')
+        df['sentiment'] = pd.Categorical(labels, categories=SENTIMENT_LABELS)
         
         logger.info(f"Successfully loaded {len(df)} records for {ticker}")
         return df
@@ -272,6 +347,38 @@ def load_dataframes(ticker):
         logger.error(f"Error loading dataframes for {ticker}: {e}")
         return pd.DataFrame()
 
+def lttb_indices(x, y, threshold: int):
+    """Pick row indices for a Largest-Triangle-Three-Buckets downsample of a series"""
+    n = len(x)
+    if threshold < 3 or threshold >= n:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    
+    # First and last points are always kept; the rest is split into threshold - 2 buckets
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    indices = np.empty(threshold, dtype=int)
+    indices[0] = 0
+    indices[-1] = n - 1
+    
+    selected = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        
+        # Keep the point forming the largest triangle with the previous pick and the next bucket's average
+        area = np.abs(
+            (x[selected] - avg_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (avg_y - y[selected])
+        )
+        selected = start + int(area.argmax())
+        indices[i + 1] = selected
+    
+    return indices
+
 def get_company_info(symbol: str) -> tuple[bool, dict]:
     """Get company information using yfinance"""
     try:
@@ -282,7 +389,7 @@ def get_company_info(symbol: str) -> tuple[bool, dict]:
         
         # Check with yfinance
         ticker = yf.Ticker(symbol)
-        info = ticker.info
+        info = get_ticker_info(symbol)
         
         # Get recent price history for additional metrics
         hist = ticker.history(period="5d")
@@ -354,37 +461,61 @@ def get_company_info(symbol: str) -> tuple[bool, dict]:
         return False, {"error": f"Error fetching company info: {str(e)}"}
 
 # In-memory cache with TTL
+# Worker threads (e.g. get_ticker_info under asyncio.to_thread) read, expire and
+# invalidate entries concurrently, so every method looks keys up with get() and
+# removes them with pop(key, None) rather than indexing or del
 class CacheManager:
     def __init__(self):
         self._cache = {}
-        self._timestamps = {}
+        self._expires = {}
         self._ttl = 300  # 5 minutes default TTL
     
     def get(self, key: str):
-        if key in self._cache:
-            if datetime.now() - self._timestamps[key] < timedelta(seconds=self._ttl):
-                return self._cache[key]
-            else:
-                del self._cache[key]
-                del self._timestamps[key]
+        expires = self._expires.get(key)
+        if expires is not None:
+            if datetime.now() < expires:
+                return self._cache.get(key)
+            self._cache.pop(key, None)
+            self._expires.pop(key, None)
         return None
     
     def set(self, key: str, value: Any, ttl: int = None):
+        # Each entry carries its own expiry so callers' TTLs are honored
         self._cache[key] = value
-        self._timestamps[key] = datetime.now()
-        if ttl:
-            # Custom TTL per item if needed
-            pass
+        self._expires[key] = datetime.now() + timedelta(seconds=ttl or self._ttl)
     
     def invalidate(self, pattern: str = None):
         if pattern:
-            keys_to_remove = [k for k in self._cache.keys() if pattern in k]
+            keys_to_remove = [k for k in list(self._cache) if pattern in k]
             for key in keys_to_remove:
-                del self._cache[key]
-                del self._timestamps[key]
+                self._cache.pop(key, None)
+                self._expires.pop(key, None)
+    
+    def clear(self):
+        self._cache.clear()
+        self._expires.clear()
 
 cache = CacheManager()
 
+def clear_data_caches():
+    """Drop memoized JSON payloads and ticker frames so their memory is released"""
+    # Entries are keyed on file signatures and never go stale, so this only frees
+    # memory; it is reserved for the admin clear-all since it affects every ticker
+    load_json_cached.cache_clear()
+    _load_dataframes_cached.cache_clear()
+
+def get_ticker_info(symbol: str) -> dict:
+    """Return yfinance's info dict for a symbol, shared across endpoints for a few minutes"""
+    import yfinance as yf
+    
+    cache_key = f"ticker_info_{symbol}"
+    info = cache.get(cache_key)
+    if info is None:
+        info = yf.Ticker(symbol).info
+        if info:
+            cache.set(cache_key, info, ttl=300)
+    return info
+
 # Simple authentication models
 class LoginRequest(BaseModel):
     password: str = Field(..., min_length=1, description="Master password for StockScope access")
@@ -633,15 +764,20 @@ def calculate_enhanced_metrics(df) -> SentimentMetrics:
             trend="neutral"
         )
     
-    avg_sentiment = df['compound'].mean()
+    # Summary statistics in one aggregation call rather than separate reductions
+    stats = df['compound'].agg(['mean', 'std'])
+    avg_sentiment = stats['mean']
     
-    # Calculate sentiment distribution
-    positive = len(df[df['compound'] > 0.1])
-    negative = len(df[df['compound'] < -0.1]) 
-    neutral = len(df) - positive - negative
+    # Calculate sentiment distribution by bucketing the raw array in one pass;
+    # exactly +/-0.1 stays neutral, matching the strict > 0.1 / < -0.1 thresholds.
+    # searchsorted sorts NaN past every edge, so missing scores are counted as
+    # neutral (as the comparisons did) by filling them before bucketing
+    compound = df['compound'].fillna(0.0).to_numpy()
+    buckets = np.searchsorted(SENTIMENT_BUCKET_EDGES, compound, side='right')
+    negative, neutral, positive = np.bincount(buckets, minlength=3).tolist()
     
     # Calculate confidence score based on data volume and consistency
-    confidence = min(1.0, len(df) / 100) * (1 - df['compound'].std())
+    confidence = min(1.0, len(df) / 100) * (1 - stats['std'])
     
     # Determine trend
     if avg_sentiment > 0.1:
@@ -658,6 +794,16 @@ def calculate_enhanced_metrics(df) -> SentimentMetrics:
         trend=trend
     )
 
+def aggregate_by_source(df) -> dict:
+    """Per-source post count, mean compound and latest timestamp, keyed by source"""
+    # One groupby pass instead of a boolean mask per source; observed=True skips
+    # categories with no rows and sort=False keeps first-seen order
+    aggregations = {'count': ('compound', 'size'), 'avg_sentiment': ('compound', 'mean')}
+    # created_utc is already UTC datetime64 from load_dataframes
+    if 'created_utc' in df.columns:
+        aggregations['latest_update'] = ('created_utc', 'max')
+    return df.groupby('source', observed=True, sort=False).agg(**aggregations).to_dict('index')
+
 # API Endpoints
 
 @app.get("/", tags=["Health"])
@@ -744,16 +890,20 @@ async def get_stock_suggestions(
             result = suggestions[:limit]
         else:
             q = q.upper()
-            matches = [
-                stock for stock in suggestions
-                if q in stock["symbol"] or q in stock["name"].upper()
-            ]
             
-            # Enhanced relevance sorting
-            exact_matches = [s for s in matches if s["symbol"] == q]
-            prefix_matches = [s for s in matches if s["symbol"].startswith(q) and s not in exact_matches]
-            name_matches = [s for s in matches if q in s["name"].upper() and s not in exact_matches + prefix_matches]
-            other_matches = [s for s in matches if s not in exact_matches + prefix_matches + name_matches]
+            # Enhanced relevance sorting: bucket each stock once by its best match
+            # kind instead of re-scanning the match lists for membership
+            exact_matches, prefix_matches, name_matches, other_matches = [], [], [], []
+            for stock in suggestions:
+                symbol = stock["symbol"]
+                if symbol == q:
+                    exact_matches.append(stock)
+                elif symbol.startswith(q):
+                    prefix_matches.append(stock)
+                elif q in stock["name"].upper():
+                    name_matches.append(stock)
+                elif q in symbol:
+                    other_matches.append(stock)
             
             result = (exact_matches + prefix_matches + name_matches + other_matches)[:limit]
         
@@ -765,12 +915,57 @@ async def get_stock_suggestions(
         logger.error(f"Error getting suggestions: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch suggestions")
 
+# Parallel yfinance company-name lookups per portfolio request
+NAME_LOOKUP_CONCURRENCY = 8
+
+def fetch_price_changes(tickers) -> dict:
+    """Fetch last close and daily change for many tickers with one batched yfinance download"""
+    import yfinance as yf
+    if not tickers:
+        return {}
+    
+    try:
+        data = yf.download(list(tickers), period="2d", auto_adjust=True, progress=False, threads=True)
+        closes = data['Close']
+        if isinstance(closes, pd.Series):
+            closes = closes.to_frame(tickers[0])
+    except Exception as price_error:
+        logger.debug(f"Failed to download price data for {tickers}: {price_error}")
+        return {}
+    
+    price_changes = {}
+    for ticker in tickers:
+        if ticker not in closes.columns:
+            continue
+        hist = closes[ticker].dropna()
+        if hist.empty:
+            continue
+        
+        current_price = hist.iloc[-1]
+        prev_price = hist.iloc[-2] if len(hist) >= 2 else current_price
+        
+        price_change = current_price - prev_price
+        price_change_percent = (price_change / prev_price * 100) if prev_price != 0 else 0
+        
+        price_changes[ticker] = {
+            "currentPrice": round(float(current_price), 2),
+            "priceChange": round(float(price_change), 2),
+            "priceChangePercent": round(float(price_change_percent), 2)
+        }
+    return price_changes
+
+def fetch_company_name(ticker) -> str:
+    """Look up a ticker's display name from yfinance, falling back to the symbol"""
+    try:
+        info = get_ticker_info(ticker)
+        return info.get('longName', info.get('shortName', ticker))
+    except Exception as info_error:
+        logger.debug(f"Failed to get company name for {ticker}: {info_error}")
+        return ticker
+
 @app.get("/api/stocks", tags=["Portfolio"])
 async def get_available_stocks(current_user: str = Depends(verify_password_with_role)):
     """Get list of analyzed stocks with metadata including current prices"""
-    import yfinance as yf
-    import pandas as pd
-    
     cache_key = "available_stocks"
     cached_result = cache.get(cache_key)
     if cached_result:
@@ -779,9 +974,25 @@ async def get_available_stocks(current_user: str = Depends(verify_password_with_
     try:
         tickers = get_available_tickers()
         
-        # Enhanced response with metadata and price data
+        # Prices for every ticker come from one batched download; company names
+        # need a per-ticker lookup, so those run in worker threads alongside it,
+        # at most NAME_LOOKUP_CONCURRENCY at a time
+        semaphore = asyncio.Semaphore(NAME_LOOKUP_CONCURRENCY)
+        
+        async def fetch_name(ticker):
+            async with semaphore:
+                return await asyncio.to_thread(fetch_company_name, ticker)
+        
+        price_changes, *company_names = await asyncio.gather(
+            asyncio.to_thread(fetch_price_changes, tickers),
+            *(fetch_name(ticker) for ticker in tickers)
+        )
+        
+        # Enhanced response with metadata and price data; one clock read serves
+        # every ticker's fallback timestamp
+        now = datetime.now()
         stocks_with_metadata = []
-        for ticker in tickers:
+        for ticker, company_name in zip(tickers, company_names):
             try:
                 # Quick metadata without full dataframe load
                 df = load_dataframes(ticker)
@@ -793,17 +1004,16 @@ async def get_available_stocks(current_user: str = Depends(verify_password_with_
                     "companyName": ticker,
                     "total_posts": 0,
                     "avg_sentiment": 0,
-                    "last_updated": datetime.now(),
+                    "last_updated": now,
                     "sources": []
                 }
                 
                 if not df.empty:
-                    # Ensure timezone-aware timestamp calculation
+                    # created_utc is already UTC datetime64 from load_dataframes
                     if 'created_utc' in df.columns and not df.empty:
-                        timestamps = pd.to_datetime(df['created_utc'], utc=True)
-                        last_updated = timestamps.max()
+                        last_updated = df['created_utc'].max()
                     else:
-                        last_updated = datetime.now().replace(tzinfo=pd.Timestamp.now().tz)
+                        last_updated = now
                         
                     stock_info.update({
                         "total_posts": len(df),
@@ -812,29 +1022,10 @@ async def get_available_stocks(current_user: str = Depends(verify_password_with_
                         "sources": list(df['source'].unique()) if 'source' in df.columns else []
                     })
                 
-                # Fetch current price data
-                try:
-                    stock = yf.Ticker(ticker)
-                    info = stock.info
-                    hist = stock.history(period="2d")
-                    
-                    if not hist.empty and len(hist) >= 1:
-                        current_price = hist['Close'].iloc[-1]
-                        prev_price = hist['Close'].iloc[-2] if len(hist) >= 2 else current_price
-                        
-                        price_change = current_price - prev_price
-                        price_change_percent = (price_change / prev_price * 100) if prev_price != 0 else 0
-                        
-                        stock_info.update({
-                            "currentPrice": round(float(current_price), 2),
-                            "priceChange": round(float(price_change), 2),
-                            "priceChangePercent": round(float(price_change_percent), 2),
-                            "companyName": info.get('longName', info.get('shortName', ticker))
-                        })
-                    
-                except Exception as price_error:
-                    logger.debug(f"Failed to get price data for {ticker}: {price_error}")
-                    # Keep default values if price fetch fails
+                # Price data was fetched up front; keep defaults if it failed
+                if ticker in price_changes:
+                    stock_info.update(price_changes[ticker])
+                    stock_info["companyName"] = company_name
                 
                 stocks_with_metadata.append(stock_info)
                 
@@ -853,8 +1044,6 @@ async def get_available_stocks(current_user: str = Depends(verify_password_with_
 @app.get("/api/stocks/{symbol}", response_model=EnhancedAnalysisResult, tags=["Analysis"])
 async def get_stock_analysis(symbol: str, current_user: str = Depends(verify_password_with_role)) -> EnhancedAnalysisResult:
     """Get comprehensive analysis for a specific stock with caching"""
-    import pandas as pd  # Add pandas import for timezone operations
-    
     symbol = symbol.upper()
     
     # Check cache first
@@ -870,38 +1059,31 @@ async def get_stock_analysis(symbol: str, current_user: str = Depends(verify_pas
         
         # Calculate enhanced metrics
         sentiment_metrics = calculate_enhanced_metrics(df)
+        now = datetime.now()
         
         # Analyze by source
         source_analyses = []
         if 'source' in df.columns:
-            for source in df['source'].unique():
-                source_df = df[df['source'] == source]
-                
-                # Ensure all timestamps are timezone-aware before calculating max
-                if 'created_utc' in source_df.columns and not source_df['created_utc'].empty:
-                    # Convert any remaining timezone-naive timestamps to UTC
-                    timestamps = pd.to_datetime(source_df['created_utc'], utc=True)
-                    latest_update = timestamps.max()
-                else:
-                    latest_update = datetime.now().replace(tzinfo=pd.Timestamp.now().tz)
+            for source, row in aggregate_by_source(df).items():
+                latest_update = row.get('latest_update')
+                if latest_update is None:
+                    latest_update = now
                 
                 source_analyses.append(SourceAnalysis(
                     source=source,
-                    count=len(source_df),
-                    avg_sentiment=float(source_df['compound'].mean()),
+                    count=int(row['count']),
+                    avg_sentiment=float(row['avg_sentiment']),
                     latest_update=latest_update
                 ))
         
         # Calculate data quality score
         data_quality = min(1.0, len(df) / 50) * (1 - abs(sentiment_metrics.avg_sentiment - df['compound'].median()))
         
-        # Ensure last_updated is timezone-aware
+        # created_utc is already UTC datetime64 from load_dataframes
         if 'created_utc' in df.columns and not df.empty:
-            # Convert any remaining timezone-naive timestamps to UTC before calculating max
-            timestamps = pd.to_datetime(df['created_utc'], utc=True)
-            last_updated = timestamps.max()
+            last_updated = df['created_utc'].max()
         else:
-            last_updated = datetime.now().replace(tzinfo=pd.Timestamp.now().tz)
+            last_updated = now
         
         result = EnhancedAnalysisResult(
             ticker=symbol,
@@ -932,13 +1114,14 @@ async def analyze_stock(request: StockRequest, background_tasks: BackgroundTasks
         return analysis_status[symbol]
     
     # Initialize status tracking
+    now = datetime.now()
     analysis_status[symbol] = AnalysisStatus(
         symbol=symbol,
         status="pending",
         progress=0,
         message="Analysis queued",
-        started_at=datetime.now(),
-        estimated_completion=datetime.now() + timedelta(minutes=2)
+        started_at=now,
+        estimated_completion=now + timedelta(minutes=2)
     )
     
     # Start background analysis
@@ -957,10 +1140,10 @@ async def get_analysis_status(symbol: str, current_user: str = Depends(verify_pa
     symbol = symbol.upper()
     
     if symbol not in analysis_status:
-        # Check if data already exists
+        # Check if data already exists; a stat of the data files is enough here,
+        # there is no need to parse them ("[]" is the 2-byte empty file)
         try:
-            df = load_dataframes(symbol)
-            if not df.empty:
+            if any(size > 2 for _, _, size in get_ticker_data_files(symbol)):
                 return AnalysisStatus(
                     symbol=symbol,
                     status="completed",
@@ -991,14 +1174,13 @@ async def get_investment_advice(symbol: str, current_user: str = Depends(verify_
         if df.empty:
             raise HTTPException(status_code=404, detail=f"No analysis data found for {symbol}")
 
+        from analysis.investment_advisor import InvestmentAdvisor
+        
         # Use your existing InvestmentAdvisor with correct method name
         advisor = InvestmentAdvisor(symbol)
-        
-        # First fetch the stock data
-        if not advisor.fetch_data():
-            raise HTTPException(status_code=500, detail="Failed to fetch stock price data")
 
-        # Get the recommendation using the original comprehensive method
+        # Get the recommendation using the original comprehensive method; it
+        # fetches the price history itself and reports failures as 'error'
         comprehensive_analysis = advisor.analyze_investment_opportunity(symbol, df)
         
         if comprehensive_analysis.get('error'):
@@ -1075,8 +1257,11 @@ async def get_quantitative_analysis(symbol: str, current_user: str = Depends(ver
         if df.empty:
             raise HTTPException(status_code=404, detail=f"No analysis data found for {symbol}")
         
-        # Create sentiment data structure for quantitative strategies
-        sentiment_data = {symbol: df.to_dict('records')}
+        # Create sentiment data structure for quantitative strategies; the strategies
+        # used here only read compound scores, so skip materializing the other columns
+        sentiment_data = {symbol: df[['compound']].to_dict('records')}
+        
+        from analysis.quantitative_strategies import QuantitativeStrategies
         
         # Use your existing QuantitativeStrategies
         quant = QuantitativeStrategies()
@@ -1161,24 +1346,18 @@ async def get_company_info_endpoint(symbol: str, current_user: str = Depends(ver
 @app.get("/api/stocks/{symbol}/news", tags=["Analysis"])
 async def get_stock_news(symbol: str, limit: int = 20, current_user: str = Depends(verify_password_with_role)):
     """Get news articles for a specific stock"""
-    import os
-    import json
-    
     symbol = symbol.upper()
     
     try:
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
-        
         # Look for news files for this ticker
         news_articles = []
         
-        for filename in os.listdir(data_dir):
-            if filename.startswith(f"{symbol}_") and 'news' in filename and filename.endswith('.json'):
-                file_path = os.path.join(data_dir, filename)
+        for filename, mtime_ns, size in get_ticker_data_files(symbol):
+            if 'news' in filename:
+                file_path = os.path.join(DATA_DIR, filename)
                 
                 try:
-                    with open(file_path, 'r') as f:
-                        articles = json.load(f)
+                    articles = load_json_cached(file_path, mtime_ns, size)
                     
                     # Add these articles to our collection
                     if isinstance(articles, list):
@@ -1188,11 +1367,9 @@ async def get_stock_news(symbol: str, limit: int = 20, current_user: str = Depen
                     logger.warning(f"Error reading news file {filename}: {e}")
                     continue
         
-        # Sort by publication date (most recent first)
-        news_articles.sort(key=lambda x: x.get('publishedAt', ''), reverse=True)
-        
-        # Limit results
-        news_articles = news_articles[:limit]
+        # Most recent first; only `limit` articles are returned, so select them
+        # with a bounded heap instead of sorting every article
+        news_articles = heapq.nlargest(limit, news_articles, key=lambda x: x.get('publishedAt', ''))
         
         return {
             "ticker": symbol,
@@ -1209,12 +1386,13 @@ async def get_price_history(
     symbol: str, 
     period: str = "1y",
     interval: str = "1d",
+    max_points: Optional[int] = Query(None, ge=3, le=10000, description="Downsample to at most this many points (default: return every row)"),
     current_user: str = Depends(verify_password_with_role)
 ):
     """Get historical price data for charting"""
     symbol = symbol.upper()
     
-    cache_key = f"price_history_{symbol}_{period}_{interval}"
+    cache_key = f"price_history_{symbol}_{period}_{interval}_{max_points}"
     cached_result = cache.get(cache_key)
     if cached_result:
         return cached_result
@@ -1231,21 +1409,39 @@ async def get_price_history(
         if hist.empty:
             raise HTTPException(status_code=404, detail="No historical data found")
         
-        # Convert to list of dictionaries for frontend consumption
-        price_data = []
-        for date, row in hist.iterrows():
-            price_data.append({
-                "date": date.strftime("%Y-%m-%d"),
-                "timestamp": int(date.timestamp() * 1000),  # JavaScript timestamp
-                "open": round(float(row['Open']), 2),
-                "high": round(float(row['High']), 2),
-                "low": round(float(row['Low']), 2),
-                "close": round(float(row['Close']), 2),
-                "volume": int(row['Volume'])
-            })
+        # Long intraday ranges produce more bars than a chart can show; callers that
+        # opt in get the visually significant ones so the payload size stays bounded
+        if max_points and len(hist) > max_points:
+            keep = lttb_indices(hist.index.asi8, hist['Close'].to_numpy(), max_points)
+            hist = hist.iloc[keep]
+        
+        # Convert to list of dictionaries for frontend consumption; every field is
+        # formatted column-wise first so the loop only zips plain Python values
+        dates = hist.index.strftime("%Y-%m-%d").tolist()
+        index = hist.index if hist.index.tz is not None else hist.index.tz_localize('UTC')
+        epoch = pd.Timestamp("1970-01-01", tz="UTC")
+        timestamps = ((index - epoch) // pd.Timedelta(milliseconds=1)).tolist()  # JavaScript timestamp
+        prices = hist[['Open', 'High', 'Low', 'Close']].round(2)
+        price_data = [
+            {
+                "date": date,
+                "timestamp": timestamp,
+                "open": open_,
+                "high": high,
+                "low": low,
+                "close": close,
+                "volume": volume
+            }
+            for date, timestamp, open_, high, low, close, volume in zip(
+                dates, timestamps,
+                prices['Open'].tolist(), prices['High'].tolist(),
+                prices['Low'].tolist(), prices['Close'].tolist(),
+                hist['Volume'].astype('int64').tolist()
+            )
+        ]
         
         # Get current price info
-        info = ticker.info
+        info = get_ticker_info(symbol)
         current_price = info.get('currentPrice', info.get('regularMarketPrice', 0))
         price_change = info.get('regularMarketChange', 0)
         price_change_percent = info.get('regularMarketChangePercent', 0)
@@ -1278,8 +1474,8 @@ async def clear_cache(pattern: Optional[str] = None, current_user: str = Depends
             cache.invalidate(pattern)
             return {"message": f"Cache cleared for pattern: {pattern}"}
         else:
-            cache._cache.clear()
-            cache._timestamps.clear()
+            cache.clear()
+            clear_data_caches()
             return {"message": "All cache cleared"}
     except Exception as e:
         logger.error(f"Error clearing cache: {e}")
@@ -1361,6 +1557,30 @@ async def delete_stock(symbol: str, current_user: str = Depends(verify_password_
         logger.error(f"Error deleting stock data for {symbol}: {e}")
         raise HTTPException(status_code=500, detail="Failed to delete stock data")
 
+def fetch_sec_pipeline(symbol: str):
+    """Run the SEC collection pipeline"""
+    from main import run_full_pipeline
+    
+    return run_full_pipeline(symbol)
+
+def fetch_news_with_fallback(symbol: str):
+    """Fetch news sentiment, falling back to the basic scraper if the enhanced one fails"""
+    from scraping.enhanced_news_scraper import fetch_enhanced_news_sentiment
+    from scraping.news_scraper import fetch_news_sentiment
+    
+    try:
+        # Use enhanced news scraper for better coverage
+        return fetch_enhanced_news_sentiment(symbol)
+    except Exception as e:
+        print(f"Enhanced news scraper failed, falling back to basic scraper: {e}")
+        return fetch_news_sentiment(symbol)
+
+# Blocking fetcher and status message for each analysis source
+SOURCE_FETCHERS = {
+    "sec": (fetch_sec_pipeline, "Collecting SEC data..."),
+    "news": (fetch_news_with_fallback, "Fetching news sentiment..."),
+}
+
 async def run_optimized_analysis(symbol: str, sources: List[str]):
     """Optimized background analysis with progress tracking"""
     try:
@@ -1369,21 +1589,17 @@ async def run_optimized_analysis(symbol: str, sources: List[str]):
         analysis_status[symbol].progress = 10
         analysis_status[symbol].message = "Starting analysis..."
         
-        # Run analysis based on sources
-        if "sec" in sources:
+        # The source fetches are independent network-bound calls, so run them
+        # concurrently in worker threads instead of one after another on the event loop
+        selected = [source for source in SOURCE_FETCHERS if source in sources]
+        if selected:
             analysis_status[symbol].progress = 30
-            analysis_status[symbol].message = "Collecting SEC data..."
-            await run_full_pipeline_async(symbol)
-        
-        if "news" in sources:
-            analysis_status[symbol].progress = 60
-            analysis_status[symbol].message = "Fetching news sentiment..."
-            try:
-                # Use enhanced news scraper for better coverage
-                fetch_enhanced_news_sentiment(symbol)
-            except Exception as e:
-                print(f"Enhanced news scraper failed, falling back to basic scraper: {e}")
-                fetch_news_sentiment(symbol)
+            analysis_status[symbol].message = " ".join(SOURCE_FETCHERS[source][1] for source in selected)
+            
+            fetches = [asyncio.to_thread(SOURCE_FETCHERS[source][0], symbol) for source in selected]
+            for completed, fetch in enumerate(asyncio.as_completed(fetches), start=1):
+                await fetch
+                analysis_status[symbol].progress = 30 + 50 * completed // len(fetches)
         
         # Final processing
         analysis_status[symbol].progress = 90
@@ -1430,16 +1646,17 @@ async def get_sentiment_analysis(symbol: str, current_user: str = Depends(verify
         
         # Calculate enhanced metrics
         enhanced_metrics = calculate_enhanced_metrics(df)
+        now = datetime.now().isoformat()
         
         # Create source analysis
         sources = []
-        for source in df['source'].unique():
-            source_df = df[df['source'] == source]
+        for source, row in aggregate_by_source(df).items():
+            latest_update = row.get('latest_update')
             sources.append({
                 "source": source,
-                "count": len(source_df),
-                "avg_sentiment": source_df['compound'].mean(),
-                "latest_update": source_df['created_utc'].max().isoformat() if 'created_utc' in source_df.columns else datetime.now().isoformat()
+                "count": int(row['count']),
+                "avg_sentiment": float(row['avg_sentiment']),
+                "latest_update": latest_update.isoformat() if latest_update is not None else now
             })
         
         result = {
@@ -1452,7 +1669,7 @@ async def get_sentiment_analysis(symbol: str, current_user: str = Depends(verify
                 "trend": enhanced_metrics.trend
             },
             "sources": sources,
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": now,
             "data_quality_score": min(1.0, len(df) / 100)
         }
         
@@ -144,7 +144,7 @@ def fetch_quarterlies(ticker: str) -> Dict[str, pd.Series]:
                 LOG.debug("[fund] FCF calculated for %s using OCF - CapEx", ticker)
             else:
                 # Fallback: FCF = OCF (when CapEx missing)
-                fcf = ocf.copy().sort_index()
+                fcf = ocf.sort_index()
                 LOG.debug("[fund] FCF fallback for %s: using OCF only (no CapEx data)", ticker)
         else:
             LOG.debug("[fund] No FCF for %s: missing OCF", ticker)
@@ -183,7 +183,7 @@ def fetch_quarterlies(ticker: str) -> Dict[str, pd.Series]:
                 cash_and_sti = (cash_total + sti.fillna(0)).replace({0: pd.NA})
                 LOG.debug("[fund] Cash total for %s: cash + short term investments", ticker)
             else:
-                cash_and_sti = cash.copy()
+                cash_and_sti = cash
                 LOG.debug("[fund] Cash total for %s: cash only (no STI)", ticker)
         else:
             LOG.debug("[fund] No cash data for %s", ticker)
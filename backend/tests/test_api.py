@@ -0,0 +1,234 @@
+"""Tests for backend API helpers."""
+
+import asyncio
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+# api.py refuses to import without the role passwords configured
+for _var in ("ADMIN_PASSWORD", "DEMO_PASSWORD", "GUEST_PASSWORD"):
+    os.environ.setdefault(_var, "test")
+
+from backend import api
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point the loaders at an empty temporary data directory."""
+    monkeypatch.setattr(api, "DATA_DIR", str(tmp_path))
+    api.clear_data_caches()
+    yield tmp_path
+    api.clear_data_caches()
+
+
+def write_data_file(directory, name, records):
+    with open(os.path.join(directory, name), "w") as f:
+        json.dump(records, f)
+
+
+def test_load_dataframes_normalizes_each_source(data_dir):
+    """News, Reddit and Twitter records come out with source, label, score and UTC time."""
+    write_data_file(data_dir, "TEST_news_sentiment.json", [{
+        "title": "Test beats estimates",
+        "publishedAt": "2024-01-02T15:30:00Z",
+        "source": "Reuters",
+        "sentiment": {"neg": 0.0, "neu": 0.5, "pos": 0.5, "compound": 0.6, "label": "positive"},
+    }])
+    write_data_file(data_dir, "TEST_reddit_sentiment.json", [{
+        "title": "Thoughts on TEST?",
+        "created_utc": 1704067200,
+        "created": "2024-01-01 00:00:00",
+        "subreddit": "stocks",
+        "sentiment": {"neg": 0.0, "neu": 1.0, "pos": 0.0, "compound": 0.0, "label": "neutral"},
+    }])
+    write_data_file(data_dir, "TEST_twitter_sentiment.json", [{
+        "date": "2024-01-03T08:00:00+00:00",
+        "content": "TEST is falling apart",
+        "username": "trader",
+        "sentiment": {"neg": 0.5, "neu": 0.5, "pos": 0.0, "compound": -0.6},
+        "sentiment_label": "negative",
+    }])
+
+    df = api.load_dataframes("TEST").set_index("source", drop=False)
+
+    news, reddit, twitter = df.loc["News"], df.loc["Reddit"], df.loc["Twitter"]
+    assert (news["sentiment"], news["compound"]) == ("positive", 0.6)
+    assert news["created_utc"] == pd.Timestamp("2024-01-02 15:30", tz="UTC")
+    assert (reddit["sentiment"], reddit["compound"]) == ("neutral", 0.0)
+    assert reddit["created_utc"] == pd.Timestamp("2024-01-01", tz="UTC")
+    assert (twitter["sentiment"], twitter["compound"]) == ("negative", -0.6)
+    assert twitter["created_utc"] == pd.Timestamp("2024-01-03 08:00", tz="UTC")
+    assert (twitter["title"], twitter["subreddit"]) == ("TEST is falling apart", "@trader")
+
+
+def test_load_dataframes_normalizes_sentiment_labels(data_dir, caplog):
+    """Label casing is folded and unknown labels are logged and kept as neutral."""
+    write_data_file(data_dir, "TEST_news_sentiment.json", [
+        {"title": "Upper", "sentiment": {"compound": 0.5, "label": "Positive"}},
+        {"title": "Padded", "sentiment": {"compound": -0.5, "label": " NEGATIVE "}},
+        {"title": "Odd", "sentiment": {"compound": 0.0, "label": "mixed"}},
+    ])
+
+    df = api.load_dataframes("TEST").set_index("title")
+
+    assert df["sentiment"].to_dict() == {"Upper": "positive", "Padded": "negative", "Odd": "neutral"}
+    assert "unexpected sentiment labels ['mixed']" in caplog.text
+
+def test_load_dataframes_stamps_missing_timestamps_per_request(data_dir):
+    """Records without a timestamp get the request time, not the time the cache filled."""
+    write_data_file(data_dir, "TEST_news_sentiment.json", [{
+        "title": "Undated",
+        "sentiment": {"compound": 0.2, "label": "positive"},
+    }])
+
+    first = api.load_dataframes("TEST")["created_utc"].iloc[0]
+    second = api.load_dataframes("TEST")["created_utc"].iloc[0]
+
+    assert first <= second <= pd.Timestamp.now(tz="UTC")
+    cached = api._load_dataframes_cached("TEST", api.get_ticker_data_files("TEST"))
+    assert cached["created_utc"].isna().all()
+
+
+def test_ticker_listing_and_deletion_use_data_dir(data_dir):
+    """The ticker list and the delete path see the same directory as the loader."""
+    write_data_file(data_dir, "TEST_news_sentiment.json", [{"title": "Kept"}])
+    write_data_file(data_dir, "EMPTY_news_sentiment.json", [])
+
+    assert api.get_available_tickers() == ["TEST"]
+
+    success, _, deleted_files = api.delete_stock_data("test")
+
+    assert success
+    assert deleted_files == ["TEST_news_sentiment.json"]
+    assert api.get_available_tickers() == []
+
+def test_get_stock_news_reads_from_data_dir(data_dir):
+    """News files are opened from DATA_DIR, newest first, limited to the requested count."""
+    write_data_file(data_dir, "TEST_news_sentiment.json", [
+        {"title": "Older", "publishedAt": "2024-01-01T00:00:00Z"},
+        {"title": "Newest", "publishedAt": "2024-01-03T00:00:00Z"},
+        {"title": "Middle", "publishedAt": "2024-01-02T00:00:00Z"},
+    ])
+
+    result = asyncio.run(api.get_stock_news("test", limit=2, current_user="admin"))
+
+    assert result["count"] == 2
+    assert [article["title"] for article in result["articles"]] == ["Newest", "Middle"]
+
+def test_lttb_indices_downsamples_to_threshold():
+    """LTTB keeps both endpoints and returns threshold strictly increasing indices."""
+    x = np.arange(1000)
+    y = np.sin(x / 25.0) + np.random.default_rng(0).normal(0, 0.1, len(x))
+
+    indices = api.lttb_indices(x, y, 50)
+
+    assert len(indices) == 50
+    assert indices[0] == 0
+    assert indices[-1] == len(x) - 1
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_lttb_indices_passes_short_series_through():
+    """Series that already fit within the threshold are returned unchanged."""
+    x = np.arange(10)
+
+    assert np.array_equal(api.lttb_indices(x, x * 2.0, 10), x)
+    assert np.array_equal(api.lttb_indices(x, x * 2.0, 50), x)
+
+
+def test_cache_manager_invalidate_tolerates_concurrently_expired_keys():
+    """A key expired by another thread mid-invalidate is skipped rather than raising."""
+    manager = api.CacheManager()
+    manager.set("analysis_AAPL", 1)
+    manager.set("analysis_MSFT", 2)
+    manager.set("available_stocks", 3)
+
+    # Simulate a worker's get() that has already popped half of an expired entry
+    del manager._expires["analysis_MSFT"]
+    manager.invalidate("analysis_")
+
+    assert manager.get("analysis_AAPL") is None
+    assert manager.get("available_stocks") == 3
+
+    manager.clear()
+    assert manager.get("available_stocks") is None
+
+
+def test_cache_manager_get_tolerates_half_written_entries():
+    """get() treats an entry whose expiry is missing as absent instead of raising."""
+    manager = api.CacheManager()
+    manager.set("ticker_info_AAPL", {"symbol": "AAPL"})
+    del manager._expires["ticker_info_AAPL"]
+
+    assert manager.get("ticker_info_AAPL") is None
+    assert manager.get("missing") is None
+
+
+def test_sentiment_distribution_matches_strict_thresholds():
+    """Scores of exactly +/-0.1 are neutral and counts match > 0.1 / < -0.1 comparisons."""
+    compound = np.concatenate([
+        [-0.1, 0.1, np.nextafter(0.1, np.inf), np.nextafter(-0.1, -np.inf), 0.0, 1.0, -1.0],
+        np.random.default_rng(0).uniform(-1, 1, 500),
+    ])
+
+    metrics = api.calculate_enhanced_metrics(pd.DataFrame({"compound": compound}))
+
+    positive = int((compound > 0.1).sum())
+    negative = int((compound < -0.1).sum())
+    assert metrics.sentiment_distribution == {
+        "positive": positive,
+        "neutral": len(compound) - positive - negative,
+        "negative": negative,
+    }
+    edge_only = api.calculate_enhanced_metrics(pd.DataFrame({"compound": [-0.1, 0.1]}))
+    assert edge_only.sentiment_distribution == {"positive": 0, "neutral": 2, "negative": 0}
+    with_missing = api.calculate_enhanced_metrics(pd.DataFrame({"compound": [np.nan, 0.5, -0.5, np.nan]}))
+    assert with_missing.sentiment_distribution == {"positive": 1, "neutral": 2, "negative": 1}
+
+
+def make_download(closes):
+    """Build a yf.download-style frame with (Price, Ticker) MultiIndex columns."""
+    frame = pd.DataFrame(closes, index=pd.to_datetime(["2024-01-02", "2024-01-03"]))
+    frame.columns = pd.MultiIndex.from_product([["Close"], frame.columns], names=["Price", "Ticker"])
+    return frame
+
+
+@patch("yfinance.download")
+def test_fetch_price_changes_single_ticker(mock_download):
+    """One ticker works with both MultiIndex and flat download columns."""
+    expected = {"AAPL": {"currentPrice": 110.0, "priceChange": 10.0, "priceChangePercent": 10.0}}
+
+    mock_download.return_value = make_download({"AAPL": [100.0, 110.0]})
+    assert api.fetch_price_changes(["AAPL"]) == expected
+
+    mock_download.return_value = make_download({"AAPL": [100.0, 110.0]}).droplevel("Ticker", axis=1)
+    assert api.fetch_price_changes(["AAPL"]) == expected
+
+
+@patch("yfinance.download")
+def test_fetch_price_changes_several_tickers(mock_download):
+    """Each ticker gets the per-ticker loop's {symbol: change} shape; missing or all-NaN ones are skipped."""
+    mock_download.return_value = make_download({
+        "AAPL": [100.0, 110.0],
+        "MSFT": [np.nan, 400.0],
+        "DEAD": [np.nan, np.nan],
+    })
+
+    result = api.fetch_price_changes(["AAPL", "MSFT", "DEAD", "GONE"])
+
+    assert result == {
+        "AAPL": {"currentPrice": 110.0, "priceChange": 10.0, "priceChangePercent": 10.0},
+        "MSFT": {"currentPrice": 400.0, "priceChange": 0.0, "priceChangePercent": 0.0},
+    }
+    mock_download.assert_called_once()
+
+
+@patch("yfinance.download", side_effect=Exception("network down"))
+def test_fetch_price_changes_download_failure(mock_download):
+    """A failed download leaves every ticker without price data, as the old loop did."""
+    assert api.fetch_price_changes(["AAPL", "MSFT"]) == {}
+    assert api.fetch_price_changes([]) == {}
@@ -1,9 +1,5 @@
 # main.py
 
-from scraping.reddit_scraper import fetch_reddit_posts
-# from scraping.twitter_scraper import fetch_twitter_sentiment  # COMMENTED OUT - Twitter API disabled until paid access
-from scraping.sec_scraper import fetch_sec_sentiment
-from sentiment.analyzer import analyze_sentiment
 from datetime import datetime
 import json
 import os
@@ -11,6 +7,9 @@ import asyncio
 
 async def run_pipeline(ticker: str, limit=20):
     """Run the complete data pipeline for Reddit data"""
+    from scraping.reddit_scraper import fetch_reddit_posts
+    from sentiment.analyzer import analyze_sentiment
+    
     # Reddit scraper is now synchronous (web scraping)
     posts = fetch_reddit_posts(ticker, limit=limit)
     enriched_posts = []
@@ -41,6 +40,9 @@ async def run_pipeline(ticker: str, limit=20):
 
 async def run_full_pipeline_async(ticker: str, reddit_limit=20, twitter_limit=50, sec_limit=10):
     """Run the complete data pipeline for all sources (async version)"""
+    # from scraping.twitter_scraper import fetch_twitter_sentiment  # COMMENTED OUT - Twitter API disabled until paid access
+    from scraping.sec_scraper import fetch_sec_sentiment
+    
     results = {}
     
     # Skip Reddit data collection for now
@@ -162,7 +162,7 @@ class EnhancedNewsScraper:
                     "domains": "reuters.com,bloomberg.com,marketwatch.com,yahoo.com,cnbc.com,fool.com,seekingalpha.com,investorplace.com,benzinga.com"
                 }
                 
-                response = requests.get("https://newsapi.org/v2/everything", params=params)
+                response = self.session.get("https://newsapi.org/v2/everything", params=params, timeout=10)
                 if response.status_code == 200:
                     articles = response.json().get("articles", [])
                     
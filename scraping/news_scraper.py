@@ -13,6 +13,9 @@ BASE_URL = "https://newsapi.org/v2/everything"
 
 analyzer = SentimentIntensityAnalyzer()
 
+# Pooled session so repeated NewsAPI calls reuse the keep-alive connection
+session = requests.Session()
+
 def classify_sentiment(compound):
     if compound >= 0.05:
         return "positive"
@@ -21,6 +24,36 @@ def classify_sentiment(compound):
     else:
         return "neutral"
 
+# Relevance filter vocabularies, built once at import rather than per article
+MAJOR_TECH_STOCKS = frozenset({"tsla", "aapl", "msft", "googl", "amzn", "meta", "nvda"})
+
+# Articles about software/tech libraries and domains (less strict for major tech stocks)
+TECH_EXCLUSIONS = (
+    "pypi", "python", "django", "library", "package", "npm", 
+    "github", "repository", "framework", "software development",
+    "programming", "code", "developer"
+)
+DOMAIN_EXCLUSIONS = (
+    "domain", "website", "web hosting", "server", "hosting"
+)
+RELAXED_EXCLUSIONS = TECH_EXCLUSIONS + DOMAIN_EXCLUSIONS
+STRICT_EXCLUSIONS = TECH_EXCLUSIONS + ("api", "application", "app store") + DOMAIN_EXCLUSIONS
+
+FINANCIAL_INDICATORS = (
+    "stock", "share", "nasdaq", "nyse", "trading", "market", "analyst",
+    "earnings", "revenue", "profit", "financial", "investor", "portfolio",
+    "price target", "rating", "upgrade", "downgrade", "enterprise",
+    "corporation", "inc.", "ltd.", "company", "sales", "delivery",
+    "production", "manufacturing", "quarterly", "business", "valuation",
+    "automotive", "electric vehicle", "ev", "battery", "energy",
+    "gigafactory", "factory", "plant", "recall", "safety", "regulatory"
+)
+
+UNTRUSTED_SOURCES = (
+    "reddit", "twitter", "facebook", "instagram", "tiktok", "spam",
+    "blog.example", "localhost", "test", "dev", "staging"
+)
+
 def is_relevant_article(title, description, ticker, company_name):
     """
     Check if an article is relevant to the stock ticker.
@@ -31,27 +64,13 @@ def is_relevant_article(title, description, ticker, company_name):
     company_lower = company_name.lower() if company_name else ""
     
     # Special handling for major tech/automotive stocks - be more permissive
-    major_tech_stocks = ["tsla", "aapl", "msft", "googl", "amzn", "meta", "nvda"]
-    is_major_tech = ticker_lower in major_tech_stocks
-    
-    # Exclude articles about software/tech libraries (but be less strict for major tech stocks)
-    tech_exclusions = [
-        "pypi", "python", "django", "library", "package", "npm", 
-        "github", "repository", "framework", "software development",
-        "programming", "code", "developer"
-    ]
+    is_major_tech = ticker_lower in MAJOR_TECH_STOCKS
     
     # Only apply strict tech exclusions to non-major tech stocks
-    if not is_major_tech:
-        tech_exclusions.extend(["api", "application", "app store"])
-    
-    # Exclude domain/website related content
-    domain_exclusions = [
-        "domain", "website", "web hosting", "server", "hosting"
-    ]
+    exclusions = RELAXED_EXCLUSIONS if is_major_tech else STRICT_EXCLUSIONS
     
     # Check for tech exclusions
-    for exclusion in tech_exclusions + domain_exclusions:
+    for exclusion in exclusions:
         if exclusion in content and ticker_lower in content:
             # Additional check: if company name is also present, it might be legitimate
             if company_lower and company_lower in content:
@@ -68,17 +87,7 @@ def is_relevant_article(title, description, ticker, company_name):
             return True
     
     # For other stocks, use stricter financial context requirement
-    financial_indicators = [
-        "stock", "share", "nasdaq", "nyse", "trading", "market", "analyst",
-        "earnings", "revenue", "profit", "financial", "investor", "portfolio",
-        "price target", "rating", "upgrade", "downgrade", "enterprise",
-        "corporation", "inc.", "ltd.", "company", "sales", "delivery",
-        "production", "manufacturing", "quarterly", "business", "valuation",
-        "automotive", "electric vehicle", "ev", "battery", "energy",
-        "gigafactory", "factory", "plant", "recall", "safety", "regulatory"
-    ]
-    
-    has_financial_context = any(indicator in content for indicator in financial_indicators)
+    has_financial_context = any(indicator in content for indicator in FINANCIAL_INDICATORS)
     has_ticker = ticker_lower in content
     has_company = company_lower and company_lower in content
     
@@ -89,38 +98,34 @@ def is_trusted_source(source_name):
     Check if the news source is a trusted financial publication.
     """
     # Be more permissive - if it's not obviously unreliable, allow it
-    untrusted_sources = [
-        "reddit", "twitter", "facebook", "instagram", "tiktok", "spam",
-        "blog.example", "localhost", "test", "dev", "staging"
-    ]
-    
     # Check for obviously untrusted sources
     source_lower = source_name.lower()
-    for untrusted in untrusted_sources:
+    for untrusted in UNTRUSTED_SOURCES:
         if untrusted in source_lower:
             return False
     
     # Allow most news sources - be more inclusive
     return True
 
-def fetch_news_sentiment(ticker, limit=20):
-    TICKER_MAP = {
-        "AAPL": "Apple",
-        "TSLA": "Tesla",
-        "MSFT": "Microsoft",
-        "GOOGL": "Google",
-        "AMZN": "Amazon",
-        "META": "Meta",
-        "NFLX": "Netflix",
-        "NVDA": "Nvidia",
-        "EOSE": "Eos Energy Enterprises",
-        "PLTR": "Palantir",
-        "VG": "Virgin Galactic",
-        "VWAGY": "Volkswagen",
-        "NEXT": "NextDecade",
-        # Add more as needed
-    }
+# Company names appended to the NewsAPI query for known tickers
+TICKER_MAP = {
+    "AAPL": "Apple",
+    "TSLA": "Tesla",
+    "MSFT": "Microsoft",
+    "GOOGL": "Google",
+    "AMZN": "Amazon",
+    "META": "Meta",
+    "NFLX": "Netflix",
+    "NVDA": "Nvidia",
+    "EOSE": "Eos Energy Enterprises",
+    "PLTR": "Palantir",
+    "VG": "Virgin Galactic",
+    "VWAGY": "Volkswagen",
+    "NEXT": "NextDecade",
+    # Add more as needed
+}
 
+def fetch_news_sentiment(ticker, limit=20):
     company_name = TICKER_MAP.get(ticker.upper(), "")
     query = f"{ticker} {company_name}".strip()
 
@@ -132,7 +137,7 @@ def fetch_news_sentiment(ticker, limit=20):
         "apiKey": NEWS_API_KEY
     }
 
-    response = requests.get(BASE_URL, params=params)
+    response = session.get(BASE_URL, params=params, timeout=10)
     if response.status_code != 200:
         raise Exception(f"NewsAPI error: {response.status_code} - {response.text}")
 
@@ -1,11 +1,22 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from datetime import datetime, timedelta
+from functools import lru_cache
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 analyzer = SentimentIntensityAnalyzer()
 
+# One pooled session so repeated EDGAR calls reuse the same keep-alive connections;
+# EDGAR throttles bursts with 429s, so retry those with a short backoff
+session = requests.Session()
+session.mount("https://", HTTPAdapter(max_retries=Retry(
+    total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)
+)))
+REQUEST_TIMEOUT = (5, 15)  # (connect, read) seconds
+
 def classify_sentiment(compound):
     if compound >= 0.05:
         return "positive"
@@ -14,6 +25,12 @@ def classify_sentiment(compound):
     else:
         return "neutral"
 
+# Filing types that carry a sentiment signal; checked once per filing
+SENTIMENT_FORM_TYPES = frozenset({
+    '4', '8-K', '10-K', '10-Q', '13F', 'SC 13G', 'SC 13D',
+    '25-NSE', '424B2', 'FWP', '3', '5', '11-K', 'DEF 14A'
+})
+
 def get_sec_headers():
     """SEC requires User-Agent header for API access"""
     return {
@@ -22,42 +39,46 @@ def get_sec_headers():
         'Host': 'data.sec.gov'
     }
 
+# Common ticker to CIK mappings
+TICKER_CIK_MAP = {
+    "AAPL": "0000320193",
+    "MSFT": "0000789019", 
+    "GOOGL": "0001652044",
+    "AMZN": "0001018724",
+    "TSLA": "0001318605",
+    "META": "0001326801",
+    "NVDA": "0001045810",
+    "NFLX": "0001065280",
+    "PLTR": "0001321655",
+    "RKLB": "0001819994"
+}
+
 def get_company_cik(ticker):
     """Get Company CIK (Central Index Key) from ticker symbol"""
-    # Common ticker to CIK mappings
-    TICKER_CIK_MAP = {
-        "AAPL": "0000320193",
-        "MSFT": "0000789019", 
-        "GOOGL": "0001652044",
-        "AMZN": "0001018724",
-        "TSLA": "0001318605",
-        "META": "0001326801",
-        "NVDA": "0001045810",
-        "NFLX": "0001065280",
-        "PLTR": "0001321655",
-        "RKLB": "0001819994"
-    }
-    
     cik = TICKER_CIK_MAP.get(ticker.upper())
     if cik:
         return cik
     
     # Fallback: Search for CIK using SEC company tickers API
     try:
-        url = "https://www.sec.gov/files/company_tickers.json"
-        response = requests.get(url, headers=get_sec_headers())
-        
-        if response.status_code == 200:
-            companies = response.json()
-            for company_data in companies.values():
-                if company_data.get('ticker', '').upper() == ticker.upper():
-                    cik = str(company_data['cik_str']).zfill(10)
-                    return cik
+        return load_sec_ticker_ciks().get(ticker.upper())
     except Exception as e:
         print(f"⚠️ Could not find CIK for {ticker}: {e}")
     
     return None
 
+@lru_cache(maxsize=1)
+def load_sec_ticker_ciks():
+    """Download SEC's ticker list once per process and index it as ticker -> zero-padded CIK"""
+    url = "https://www.sec.gov/files/company_tickers.json"
+    response = session.get(url, headers=get_sec_headers(), timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()  # failures are not cached, so the next lookup retries
+    
+    return {
+        company_data.get('ticker', '').upper(): str(company_data['cik_str']).zfill(10)
+        for company_data in response.json().values()
+    }
+
 def fetch_sec_filings(ticker, limit=10):
     """Fetch recent SEC filings for a company"""
     cik = get_company_cik(ticker)
@@ -69,7 +90,7 @@ def fetch_sec_filings(ticker, limit=10):
     url = f"https://data.sec.gov/submissions/CIK{cik}.json"
     
     try:
-        response = requests.get(url, headers=get_sec_headers())
+        response = session.get(url, headers=get_sec_headers(), timeout=REQUEST_TIMEOUT)
         
         if response.status_code != 200:
             print(f"❌ SEC API error: {response.status_code}")
@@ -96,8 +117,7 @@ def fetch_sec_filings(ticker, limit=10):
             doc = primary_documents[i]
             
             # Focus on key filing types that indicate sentiment - EXPANDED LIST
-            if form_type in ['4', '8-K', '10-K', '10-Q', '13F', 'SC 13G', 'SC 13D', 
-                           '25-NSE', '424B2', 'FWP', '3', '5', '11-K', 'DEF 14A']:
+            if form_type in SENTIMENT_FORM_TYPES:
                 # Create filing URL
                 accession_clean = accession.replace('-', '')
                 filing_url = f"https://www.sec.gov/Archives/edgar/data/{cik.lstrip('0')}/{accession_clean}/{doc}"
@@ -127,45 +147,52 @@ def fetch_sec_filings(ticker, limit=10):
         print(f"❌ Error fetching SEC data for {ticker}: {e}")
         return []
 
+# Human-readable descriptions of SEC form types
+FILING_DESCRIPTIONS = {
+    "4": "Insider Trading - Statement of Changes in Beneficial Ownership",
+    "8-K": "Current Report - Major Corporate Events",
+    "10-K": "Annual Report - Comprehensive Company Overview", 
+    "10-Q": "Quarterly Report - Financial Performance Update",
+    "13F": "Institutional Investment Manager Holdings",
+    "SC 13G": "Beneficial Ownership Report (Passive)",
+    "SC 13D": "Beneficial Ownership Report (Active)",
+    "25-NSE": "Notice of Exempt Offering of Securities",
+    "424B2": "Prospectus Supplement - Securities Offered Pursuant to Rule 424(b)(2)",
+    "FWP": "Free Writing Prospectus",
+    "3": "Initial Statement of Beneficial Ownership",
+    "5": "Annual Statement of Changes in Beneficial Ownership",
+    "11-K": "Annual Report of Employee Stock Purchase, Savings and Similar Plans",
+    "DEF 14A": "Proxy Statement - Definitive Proxy Statement"
+}
+
 def get_filing_description(form_type):
     """Get human-readable description of SEC form types"""
-    descriptions = {
-        "4": "Insider Trading - Statement of Changes in Beneficial Ownership",
-        "8-K": "Current Report - Major Corporate Events",
-        "10-K": "Annual Report - Comprehensive Company Overview", 
-        "10-Q": "Quarterly Report - Financial Performance Update",
-        "13F": "Institutional Investment Manager Holdings",
-        "SC 13G": "Beneficial Ownership Report (Passive)",
-        "SC 13D": "Beneficial Ownership Report (Active)",
-        "25-NSE": "Notice of Exempt Offering of Securities",
-        "424B2": "Prospectus Supplement - Securities Offered Pursuant to Rule 424(b)(2)",
-        "FWP": "Free Writing Prospectus",
-        "3": "Initial Statement of Beneficial Ownership",
-        "5": "Annual Statement of Changes in Beneficial Ownership",
-        "11-K": "Annual Report of Employee Stock Purchase, Savings and Similar Plans",
-        "DEF 14A": "Proxy Statement - Definitive Proxy Statement"
-    }
-    return descriptions.get(form_type, f"SEC Form {form_type}")
+    return FILING_DESCRIPTIONS.get(form_type, f"SEC Form {form_type}")
+
+# Sentiment context templates per form type, formatted with the ticker on use
+FILING_SENTIMENT_CONTEXTS = {
+    "4": "Insider trading activity for {ticker}. Corporate executives or directors bought or sold shares, indicating their confidence in company prospects.",
+    "8-K": "Major corporate event announced for {ticker}. This current report indicates significant business developments that could impact stock performance.",
+    "10-K": "Annual comprehensive report filed for {ticker}. This detailed financial disclosure provides full business outlook and risk assessment.",
+    "10-Q": "Quarterly financial update for {ticker}. Regular business performance report showing recent financial health and operational results.",
+    "13F": "Institutional investment activity in {ticker}. Large fund managers disclosed their holdings, showing institutional confidence levels.",
+    "SC 13G": "Passive beneficial ownership filing for {ticker}. Large shareholder disclosed significant position without intent to influence control.",
+    "SC 13D": "Active beneficial ownership filing for {ticker}. Large shareholder disclosed significant position with potential intent to influence company direction.",
+    "25-NSE": "Notice of exempt offering of securities for {ticker}. Indicates a private placement of securities without registration.",
+    "424B2": "Prospectus supplement for {ticker}. Provides details of securities offered, including pricing and underwriting.",
+    "FWP": "Free writing prospectus for {ticker}. Offers additional information about a security offering, often used for complex securities.",
+    "3": "Initial statement of beneficial ownership for {ticker}. Filed by insiders to report their ownership stakes in the company.",
+    "5": "Annual statement of changes in beneficial ownership for {ticker}. Filed by insiders to report changes in their ownership stakes.",
+    "11-K": "Annual report of employee stock purchase, savings and similar plans for {ticker}. Provides information on company-sponsored employee benefit plans.",
+    "DEF 14A": "Definitive proxy statement for {ticker}. Provides details on matters to be voted on at the company's annual meeting, including executive compensation."
+}
 
 def get_filing_sentiment_context(form_type, ticker):
     """Generate sentiment context based on filing type for analysis"""
-    contexts = {
-        "4": f"Insider trading activity for {ticker}. Corporate executives or directors bought or sold shares, indicating their confidence in company prospects.",
-        "8-K": f"Major corporate event announced for {ticker}. This current report indicates significant business developments that could impact stock performance.",
-        "10-K": f"Annual comprehensive report filed for {ticker}. This detailed financial disclosure provides full business outlook and risk assessment.",
-        "10-Q": f"Quarterly financial update for {ticker}. Regular business performance report showing recent financial health and operational results.",
-        "13F": f"Institutional investment activity in {ticker}. Large fund managers disclosed their holdings, showing institutional confidence levels.",
-        "SC 13G": f"Passive beneficial ownership filing for {ticker}. Large shareholder disclosed significant position without intent to influence control.",
-        "SC 13D": f"Active beneficial ownership filing for {ticker}. Large shareholder disclosed significant position with potential intent to influence company direction.",
-        "25-NSE": f"Notice of exempt offering of securities for {ticker}. Indicates a private placement of securities without registration.",
-        "424B2": f"Prospectus supplement for {ticker}. Provides details of securities offered, including pricing and underwriting.",
-        "FWP": f"Free writing prospectus for {ticker}. Offers additional information about a security offering, often used for complex securities.",
-        "3": f"Initial statement of beneficial ownership for {ticker}. Filed by insiders to report their ownership stakes in the company.",
-        "5": f"Annual statement of changes in beneficial ownership for {ticker}. Filed by insiders to report changes in their ownership stakes.",
-        "11-K": f"Annual report of employee stock purchase, savings and similar plans for {ticker}. Provides information on company-sponsored employee benefit plans.",
-        "DEF 14A": f"Definitive proxy statement for {ticker}. Provides details on matters to be voted on at the company's annual meeting, including executive compensation."
-    }
-    return contexts.get(form_type, f"SEC regulatory filing for {ticker}")
+    template = FILING_SENTIMENT_CONTEXTS.get(form_type)
+    if template is None:
+        return f"SEC regulatory filing for {ticker}"
+    return template.format(ticker=ticker)
 
 def fetch_sec_sentiment(ticker, limit=10):
     """Main function to fetch and analyze SEC filing sentiment"""
@@ -1,5 +1,4 @@
 import tweepy
-import pandas as pd
 import json
 import os
 import sys
@@ -264,6 +263,9 @@ def fetch_twitter_data(query, max_tweets=100):
     Returns:
         pd.DataFrame: A DataFrame containing tweet data (content, date, username).
     """
+    # Only this legacy helper needs pandas; keep it off the module import path
+    import pandas as pd
+    
     client = get_twitter_client()
     if not client:
         return pd.DataFrame()
@@ -61,7 +61,7 @@ export default function PriceChart({ symbol, className = '' }: PriceChartProps)
     
     try {
       const response = await fetch(
-        `${API_BASE_URL}/api/stocks/${symbol}/price-history?period=${period}&interval=1d${getPasswordParam() ? '&' + getPasswordParam().slice(1) : ''}`
+        `${API_BASE_URL}/api/stocks/${symbol}/price-history?period=${period}&interval=1d&max_points=2000${getPasswordParam() ? '&' + getPasswordParam().slice(1) : ''}`
       )
       
       if (!response.ok) {